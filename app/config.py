@@ -1,7 +1,8 @@
 """Configuration for the v2 patient-outreach voice agent.
 
-Env-file layering: .env -> .env.local (last wins).  The load_settings()
-factory reads os.getenv() so any env-file, Azure App Service setting,
+Env-file layering: .env -> .env.local (last wins), skipped when
+APP_SKIP_DOTENV is true or running under Kubernetes.  The load_settings()
+factory reads os.environ so any env-file, Azure App Service setting,
 or shell export is honoured identically.
 
 Voice Live GA 1.1.0 adds server-side noise reduction, echo cancellation,
@@ -11,23 +12,68 @@ and manual input-flush tuning are removed; the GA SDK handles both.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+from dataclasses import dataclass
+from typing import Any, Callable
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, field_validator
+_TRUE = frozenset({"true", "1", "yes", "on"})
 
-load_dotenv()
-load_dotenv(dotenv_path=".env.local", override=True)
 
-logger = logging.getLogger("app.config")
+def _bool(value: str) -> bool:
+    """Parse an env var as a boolean (``true``/``1``/``yes``/``on``, any case)."""
+    return value.strip().lower() in _TRUE
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean env var with the same truthy set as ``Settings`` fields."""
+    raw = os.getenv(name)
+    return default if raw is None else _bool(raw)
+
+
+# Env files are a local-dev convenience; containers get env injected
+# directly, so skip the filesystem scan (and the dotenv import) there.
+if not env_flag("APP_SKIP_DOTENV") and not os.getenv("KUBERNETES_SERVICE_HOST"):
+    from dotenv import load_dotenv
 
+    load_dotenv()
+    load_dotenv(dotenv_path=".env.local", override=True)
 
-class Settings(BaseModel):
+logger = logging.getLogger("app.config")
+
+_CHANNEL_TYPES = frozenset({"mixed", "unmixed"})
+
+# Voice Live fields that must be non-empty: (env var, Settings attribute)
+_VOICELIVE_REQUIRED: tuple[tuple[str, str], ...] = (
+    ("AZURE_VOICELIVE_ENDPOINT", "voicelive_endpoint"),
+    ("VOICELIVE_MODEL", "voicelive_model"),
+    ("VOICELIVE_VOICE", "voicelive_voice"),
+)
+
+# (predicate that must hold, error message) — evaluated in order
+_VOICELIVE_CHECKS: tuple[tuple[Callable[[Settings], bool], str], ...] = (
+    (lambda s: s.media_audio_channel_type in _CHANNEL_TYPES,
+     "MEDIA_AUDIO_CHANNEL_TYPE must be 'mixed' or 'unmixed'"),
+    # VAD threshold is a probability; must be in [0.0, 1.0]
+    (lambda s: 0.0 <= s.voicelive_vad_threshold <= 1.0,
+     "VOICELIVE_VAD_THRESHOLD must be between 0.0 and 1.0"),
+    (lambda s: s.voicelive_vad_prefix_padding_ms > 0,
+     "VOICELIVE_VAD_PREFIX_PADDING_MS must be > 0"),
+    (lambda s: s.voicelive_vad_silence_duration_ms > 0,
+     "VOICELIVE_VAD_SILENCE_DURATION_MS must be > 0"),
+)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Settings:
     """Strongly-typed configuration populated from environment variables.
 
     Use ``load_settings()`` to construct; do not instantiate directly.
     Fields map 1-to-1 with env vars documented in ``ENV.md``.
+
+    A plain frozen dataclass: values come from trusted env at process
+    start, so pydantic validation bought nothing but import cost.
     """
 
     # ── Core service / ACS ──────────────────────────────────────────────
@@ -81,12 +127,20 @@ class Settings(BaseModel):
 
     # ── Validators ──────────────────────────────────────────────────────
 
-    @field_validator("app_base_url", "acs_connection_string", "acs_outbound_caller_id")
-    @classmethod
-    def _required(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("Required configuration value missing")
-        return value
+    def validate(self) -> None:
+        """Run every startup check once, after construction.
+
+        Construction itself does no per-field work, so building a
+        ``Settings`` in tests or tooling stays cheap.
+
+        Raises:
+            ValueError: If a required field is blank or Voice Live
+                config is inconsistent.
+        """
+        for value in (self.app_base_url, self.acs_connection_string, self.acs_outbound_caller_id):
+            if not value or not value.strip():
+                raise ValueError("Required configuration value missing")
+        self.validate_voicelive()
 
     def validate_voicelive(self) -> None:
         """Check Voice Live fields for consistency after construction.
@@ -95,95 +149,115 @@ class Settings(BaseModel):
             ValueError: If required Voice Live fields are missing or
                 VAD / media values are out of range.
         """
-        missing: list[str] = []
-        if not self.voicelive_endpoint:
-            missing.append("AZURE_VOICELIVE_ENDPOINT")
-        if not self.voicelive_model:
-            missing.append("VOICELIVE_MODEL")
-        if not self.voicelive_voice:
-            missing.append("VOICELIVE_VOICE")
-        if missing:
+        if not all(getattr(self, attr) for _, attr in _VOICELIVE_REQUIRED):
+            missing = [name for name, attr in _VOICELIVE_REQUIRED if not getattr(self, attr)]
             raise ValueError("Voice Live GA config missing: " + ", ".join(missing))
 
-        if self.media_audio_channel_type not in {"mixed", "unmixed"}:
-            raise ValueError("MEDIA_AUDIO_CHANNEL_TYPE must be 'mixed' or 'unmixed'")
-
-        # VAD threshold is a probability; must be in [0.0, 1.0]
-        if not 0.0 <= self.voicelive_vad_threshold <= 1.0:
-            raise ValueError("VOICELIVE_VAD_THRESHOLD must be between 0.0 and 1.0")
-        if self.voicelive_vad_prefix_padding_ms <= 0:
-            raise ValueError("VOICELIVE_VAD_PREFIX_PADDING_MS must be > 0")
-        if self.voicelive_vad_silence_duration_ms <= 0:
-            raise ValueError("VOICELIVE_VAD_SILENCE_DURATION_MS must be > 0")
-
-
-def _env_bool(name: str, default: str = "false") -> bool:
-    """Read an env var as a boolean (case-insensitive 'true')."""
-    return os.getenv(name, default).lower() == "true"
-
-
+        for check, message in _VOICELIVE_CHECKS:
+            if not check(self):
+                raise ValueError(message)
+
+
+def _conn_str(value: str) -> str:
+    """Strip whitespace and the quotes Azure portal sometimes wraps connection strings in."""
+    return value.strip().strip("\"'")
+
+
+def _first_env(env: dict[str, str], *keys: str) -> str | None:
+    """Return the value of the first key present in *env*, else None."""
+    for key in keys:
+        value = env.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+# (env var, Settings attribute, parser, default) — parsers only run on
+# values actually present in the environment; defaults are already typed.
+_FIELDS: tuple[tuple[str, str, Callable[[str], Any], Any], ...] = (
+    # Core / ACS
+    ("APP_BASE_URL", "app_base_url", str, "http://localhost:8000"),
+    ("ACS_CONNECTION_STRING", "acs_connection_string", _conn_str, ""),
+    ("ACS_OUTBOUND_CALLER_ID", "acs_outbound_caller_id", str, ""),
+    ("TARGET_PHONE_NUMBER", "target_phone_number", str, None),
+    # Voice Live GA
+    ("AZURE_VOICELIVE_ENDPOINT", "voicelive_endpoint", str, None),
+    ("VOICELIVE_MODEL", "voicelive_model", str, None),
+    ("VOICELIVE_VOICE", "voicelive_voice", str, None),
+    ("VOICELIVE_SYSTEM_PROMPT", "voicelive_system_prompt", str, None),
+    ("AZURE_VOICELIVE_API_VERSION", "voicelive_api_version", str, "2025-10-01"),
+    ("AZURE_VOICELIVE_API_KEY", "voicelive_api_key", str, None),
+    ("DEFAULT_SYSTEM_PROMPT", "default_system_prompt", str,
+     "You are a helpful voice agent. Keep responses concise."),
+    ("VOICELIVE_LANGUAGE_HINT", "voicelive_language_hint", str, None),
+    ("VOICELIVE_WAIT_FOR_CALLER", "voicelive_wait_for_caller", _bool, True),
+    # GA 1.1.0 audio processing
+    ("VOICELIVE_NOISE_REDUCTION", "voicelive_noise_reduction", _bool, True),
+    ("VOICELIVE_ECHO_CANCELLATION", "voicelive_echo_cancellation", _bool, True),
+    # Server VAD
+    ("VOICELIVE_VAD_THRESHOLD", "voicelive_vad_threshold", float, 0.5),
+    ("VOICELIVE_VAD_PREFIX_PADDING_MS", "voicelive_vad_prefix_padding_ms", int, 300),
+    ("VOICELIVE_VAD_SILENCE_DURATION_MS", "voicelive_vad_silence_duration_ms", int, 350),
+    # Foundry inference
+    ("FOUNDRY_INFERENCE_ENDPOINT", "foundry_inference_endpoint", str, None),
+    ("FOUNDRY_INFERENCE_MODEL", "foundry_inference_model", str, "gpt-4o"),
+    ("FOUNDRY_INFERENCE_API_KEY", "foundry_inference_api_key", str, None),
+    # Call lifecycle
+    ("CALL_TIMEOUT_SEC", "call_timeout_sec", int, 300),
+    ("CALL_IDLE_TIMEOUT_SEC", "call_idle_timeout_sec", int, 300),
+    ("ENABLE_CALL_RECORDING", "enable_call_recording", _bool, False),
+    # Media bridge
+    ("MEDIA_BIDIRECTIONAL", "media_bidirectional", _bool, True),
+    ("MEDIA_START_AT_CREATE", "media_start_at_create", _bool, True),
+    ("MEDIA_AUDIO_CHANNEL_TYPE", "media_audio_channel_type", str.lower, "mixed"),
+    ("MEDIA_FRAME_BYTES", "media_frame_bytes", int, 960),
+    ("MEDIA_FRAME_INTERVAL_MS", "media_frame_interval_ms", int, 20),
+    ("MEDIA_ENABLE_VL_IN", "media_enable_voicelive_in", _bool, True),
+    ("MEDIA_ENABLE_VL_OUT", "media_enable_voicelive_out", _bool, True),
+    # Application
+    ("LOG_LEVEL", "log_level", str.upper, "INFO"),
+    ("WEBSITES_PORT", "websites_port", int, 8000),
+)
+
+# Fallback env vars consulted, in order, when the primary key is unset.
+_ENV_ALIASES: dict[str, tuple[str, ...]] = {
+    # Idle timeout defaults to the hard call timeout
+    "CALL_IDLE_TIMEOUT_SEC": ("CALL_TIMEOUT_SEC",),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """Build a ``Settings`` instance from the current environment.
 
-    ACS_CONNECTION_STRING gets extra quote-stripping because Azure portal
-    sometimes wraps the value in quotes when copied.
+    The environment is snapshotted once into a plain dict, and the result
+    is memoized so repeat callers share one instance.
+    ``load_settings.cache_clear()`` only makes later direct
+    ``load_settings()`` calls re-read the environment (useful in tests);
+    it does not reload configuration.  ``app.config.settings``, imported
+    ``settings`` bindings and values derived at import (``FRAME_BYTES``,
+    the ACS host, the ACS client) keep the first instance.
     """
-    raw_conn = os.getenv("ACS_CONNECTION_STRING", "")
-    if raw_conn.startswith(("'", '"')) and raw_conn.endswith(("'", '"')):
-        raw_conn = raw_conn[1:-1]
-
-    s = Settings(
-        # Core / ACS
-        app_base_url=os.getenv("APP_BASE_URL", "http://localhost:8000"),
-        acs_connection_string=raw_conn.strip(),
-        acs_outbound_caller_id=os.getenv("ACS_OUTBOUND_CALLER_ID", ""),
-        target_phone_number=os.getenv("TARGET_PHONE_NUMBER"),
-        # Voice Live GA
-        voicelive_endpoint=os.getenv("AZURE_VOICELIVE_ENDPOINT"),
-        voicelive_model=os.getenv("VOICELIVE_MODEL"),
-        voicelive_voice=os.getenv("VOICELIVE_VOICE"),
-        voicelive_system_prompt=os.getenv("VOICELIVE_SYSTEM_PROMPT"),
-        voicelive_api_version=os.getenv("AZURE_VOICELIVE_API_VERSION", "2025-10-01"),
-        voicelive_api_key=os.getenv("AZURE_VOICELIVE_API_KEY"),
-        default_system_prompt=os.getenv(
-            "DEFAULT_SYSTEM_PROMPT",
-            "You are a helpful voice agent. Keep responses concise.",
-        ),
-        voicelive_language_hint=os.getenv("VOICELIVE_LANGUAGE_HINT"),
-        voicelive_wait_for_caller=_env_bool("VOICELIVE_WAIT_FOR_CALLER", "true"),
-        # GA 1.1.0 audio processing
-        voicelive_noise_reduction=_env_bool("VOICELIVE_NOISE_REDUCTION", "true"),
-        voicelive_echo_cancellation=_env_bool("VOICELIVE_ECHO_CANCELLATION", "true"),
-        # Server VAD
-        voicelive_vad_threshold=float(os.getenv("VOICELIVE_VAD_THRESHOLD", "0.5")),
-        voicelive_vad_prefix_padding_ms=int(os.getenv("VOICELIVE_VAD_PREFIX_PADDING_MS", "300")),
-        voicelive_vad_silence_duration_ms=int(os.getenv("VOICELIVE_VAD_SILENCE_DURATION_MS", "350")),
-        # Foundry inference
-        foundry_inference_endpoint=os.getenv("FOUNDRY_INFERENCE_ENDPOINT"),
-        foundry_inference_model=os.getenv("FOUNDRY_INFERENCE_MODEL", "gpt-4o"),
-        foundry_inference_api_key=os.getenv("FOUNDRY_INFERENCE_API_KEY"),
-        # Call lifecycle
-        call_timeout_sec=int(os.getenv("CALL_TIMEOUT_SEC", "300")),
-        call_idle_timeout_sec=int(
-            os.getenv("CALL_IDLE_TIMEOUT_SEC", os.getenv("CALL_TIMEOUT_SEC", "300"))
-        ),
-        enable_call_recording=_env_bool("ENABLE_CALL_RECORDING", "false"),
-        # Media bridge
-        media_bidirectional=_env_bool("MEDIA_BIDIRECTIONAL", "true"),
-        media_start_at_create=_env_bool("MEDIA_START_AT_CREATE", "true"),
-        media_audio_channel_type=os.getenv("MEDIA_AUDIO_CHANNEL_TYPE", "mixed").lower(),
-        media_frame_bytes=int(os.getenv("MEDIA_FRAME_BYTES", "960")),
-        media_frame_interval_ms=int(os.getenv("MEDIA_FRAME_INTERVAL_MS", "20")),
-        media_enable_voicelive_in=_env_bool("MEDIA_ENABLE_VL_IN", "true"),
-        media_enable_voicelive_out=_env_bool("MEDIA_ENABLE_VL_OUT", "true"),
-        # Application
-        log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
-        websites_port=int(os.getenv("WEBSITES_PORT", "8000")),
-    )
-    s.validate_voicelive()
+    env = os.environ.copy()
+    kwargs: dict[str, Any] = {}
+    for key, attr, parser, default in _FIELDS:
+        raw = _first_env(env, key, *_ENV_ALIASES.get(key, ()))
+        kwargs[attr] = default if raw is None else parser(raw)
+
+    s = Settings(**kwargs)
+    s.validate()
     logger.info("settings loaded  vl_endpoint=%s  model=%s", s.voicelive_endpoint, s.voicelive_model)
     return s
 
 
-settings = load_settings()
+# Declared for type checkers only; the instance is built on first access
+# by ``__getattr__`` below so importing this module stays cheap.
+settings: Settings
 
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook: build ``settings`` lazily on first attribute access."""
+    if name == "settings":
+        value = globals()["settings"] = load_settings()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,47 +1,119 @@
 """Central logging configuration for the /app service.
 
 Behavior:
- - Purges existing files in ``logs/`` so only current-run logs remain.
+ - Purges existing files in ``logs/`` so only current-run logs remain
+   (``LOG_PURGE``, a boolean defaulting to true; set it false to keep them).
  - Creates ``logs/app.log`` with rotation at ~200KB keeping several backups.
+ - File and console handlers run on a ``QueueListener`` thread; the root
+   logger only holds a ``QueueHandler``.
+ - Timestamps are UTC and end in ``Z`` (e.g. ``2024-05-01 12:00:00,123Z``);
+   earlier versions logged local time with no zone marker.
+ - A true ``LOG_JSON`` switches to one JSON object per line.
  - Honors ``LOG_LEVEL`` (default INFO). When DEBUG, enables azure.* debug visibility.
- - Idempotent: subsequent calls won't duplicate handlers.
+ - Idempotent: a module flag makes subsequent calls return immediately.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import pathlib
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import orjson
+
+from .config import env_flag
+
+
+_CONFIGURED = False
+_listener: QueueListener | None = None
+
+
+class _UtcFormatter(logging.Formatter):
+    """Formatter with UTC timestamps and a per-second ``strftime`` cache.
+
+    Records within the same wall-clock second reuse the formatted date,
+    so only the millisecond suffix is built per record.
+    """
+
+    converter = time.gmtime
+    # Trailing ``Z`` so UTC lines can't be mistaken for local time
+    default_msec_format = "%s,%03dZ"
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached_sec = -1
+        self._cached_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_prefix = time.strftime(self.default_time_format, self.converter(sec))
+        return self.default_msec_format % (self._cached_prefix, record.msecs)
+
+
+class _JsonFormatter(logging.Formatter):
+    """One compact JSON object per record, encoded with orjson.
+
+    Skips ``%``-template substitution and ``asctime`` formatting entirely;
+    ``t`` is the raw epoch timestamp.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps(
+            {"t": record.created, "lvl": record.levelname[0], "n": record.name, "m": record.getMessage()}
+        ).decode()
 
 
 def configure_logging() -> None:
+    global _CONFIGURED, _listener
+    if _CONFIGURED:
+        return
+
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
     root = logging.getLogger()
 
-    if any(isinstance(h, RotatingFileHandler) for h in root.handlers):
-        return
-
     log_dir = pathlib.Path("logs")
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    try:
-        for path in log_dir.glob("*"):
-            if path.is_file():
-                path.unlink(missing_ok=True)  # type: ignore[arg-type]
-    except Exception as exc:  # pragma: no cover
-        print(f"WARN: failed purging logs dir: {exc}")
+    if env_flag("LOG_PURGE", default=True):
+        try:
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+        except Exception as exc:  # pragma: no cover
+            print(f"WARN: failed purging logs dir: {exc}")
 
     file_handler = RotatingFileHandler(log_dir / "app.log", maxBytes=204800, backupCount=10, encoding="utf-8")
-    formatter = logging.Formatter("%(asctime)s %(levelname).1s %(name)s %(message)s")
+    formatter: logging.Formatter
+    if env_flag("LOG_JSON"):
+        formatter = _JsonFormatter()
+    else:
+        formatter = _UtcFormatter("%(asctime)s %(levelname).1s %(name)s %(message)s")
     file_handler.setFormatter(formatter)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
+    # Callers only enqueue records; disk and console I/O happen on the
+    # listener thread so logging never stalls the event loop.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     root.setLevel(level)
-    root.addHandler(file_handler)
-    root.addHandler(console_handler)
+    root.addHandler(QueueHandler(log_queue))
+    # Set only once setup has succeeded, so a failure can be retried
+    _CONFIGURED = True
 
     for noisy in ["urllib3", "aiohttp.access"]:
         logging.getLogger(noisy).setLevel(logging.WARNING)
@@ -5,8 +5,10 @@ All business logic lives in services/ and routes live in routers/.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import ssl
+from importlib import metadata
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -14,10 +16,12 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from . import auth
 from .auth import AuthMiddleware, create_session_token, load_passwords
 from .config import settings
 from .logging_config import configure_logging
 from .routers import api, calls, diagnostics, media, ws
+from .services.call_manager import call_manager
 
 configure_logging()
 logger = logging.getLogger("app.main")
@@ -51,8 +55,7 @@ async def validate_auth(req: AuthRequest):
 @app.get("/auth/status")
 async def auth_status():
     """Public endpoint — tells the frontend whether auth is enabled."""
-    from .auth import _auth_enabled
-    return {"auth_required": _auth_enabled}
+    return {"auth_required": auth._auth_enabled}
 
 
 # Serve React frontend static files (production build)
@@ -73,10 +76,22 @@ if _frontend_dist.is_dir():
         return FileResponse(str(_frontend_dist / "index.html"))
 
 
+# Strong references for fire-and-forget startup tasks
+_background_tasks: set[asyncio.Task] = set()
+
+
 @app.on_event("startup")
 async def _startup() -> None:
-    """Load auth passwords and log configuration on startup."""
+    """Load auth passwords, prime ACS, and log configuration on startup."""
+    # Python 3.12+: run new tasks synchronously up to their first suspension
+    # point, saving a loop iteration per create_task on the media/event paths.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     load_passwords()
+    # Prime the ACS connection pool so the first call skips a TLS handshake
+    warm_up = asyncio.create_task(call_manager.warm_up())
+    _background_tasks.add(warm_up)
+    warm_up.add_done_callback(_background_tasks.discard)
     versions = _get_sdk_versions()
     logger.info(
         "startup model=%s voice=%s endpoint=%s az-core=%s callauto=%s voicelive=%s openssl=%s",
@@ -92,11 +107,6 @@ async def _startup() -> None:
 
 def _get_sdk_versions() -> dict[str, str]:
     """Collect installed Azure SDK versions for diagnostics."""
-    try:
-        from importlib import metadata
-    except ImportError:
-        import importlib_metadata as metadata  # type: ignore
-
     packages = ["azure-core", "azure-communication-callautomation", "azure-ai-voicelive"]
     versions = {}
     for pkg in packages:
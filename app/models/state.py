@@ -10,6 +10,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..auth import DEFAULT_SESSION_ID
+
 
 @dataclass
 class CallState:
@@ -64,9 +66,12 @@ class VoiceLiveState:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaMetrics:
-    """Counters for the media bridge."""
+    """Counters for the media bridge.
+
+    Slotted: the record_* methods run for every media message.
+    """
     ws_connected_at: float | None = None
     started: bool = False
     in_frames: int = 0
@@ -154,14 +159,18 @@ class AppState:
         return self._calls.get(session_id)
 
     def get_last_event(self, session_id: str) -> float | None:
+        """Monotonic stamp of the session's last event (see ``update_last_event``)."""
         return self._last_events.get(session_id)
 
     def update_last_event(self, session_id: str | None = None) -> None:
-        """Non-async — single assignment is atomic in CPython."""
+        """Non-async — single assignment is atomic in CPython.
+
+        Stamps are ``time.monotonic()``: they are only used for idle
+        durations, so wall-clock adjustments must not move them.
+        """
         if session_id is None:
-            from ..auth import DEFAULT_SESSION_ID
             session_id = DEFAULT_SESSION_ID
-        self._last_events[session_id] = time.time()
+        self._last_events[session_id] = time.monotonic()
 
     # ------------------------------------------------------------------
     # Call lifecycle
@@ -173,19 +182,17 @@ class AppState:
             pass  # new-style call
         else:
             # Old-style: begin_call(call_id, prompt) — session_id is actually call_id
-            from ..auth import DEFAULT_SESSION_ID
             prompt = call_id  # type: ignore[assignment]
             call_id = session_id
             session_id = DEFAULT_SESSION_ID
         async with self._lock:
             self._calls[session_id] = CallState(call_id=call_id, prompt=prompt)  # type: ignore[arg-type]
-            self._last_events[session_id] = time.time()
+            self._last_events[session_id] = time.monotonic()
             self._media[session_id] = MediaMetrics()
 
     async def end_call(self, session_id: str, call_id: str | None = None, reason: str | None = None) -> None:
         # Support old signature: end_call(call_id, reason=...)
         if call_id is None:
-            from ..auth import DEFAULT_SESSION_ID
             call_id = session_id
             reason = reason  # noqa: PLW0127
             session_id = DEFAULT_SESSION_ID
@@ -206,7 +213,6 @@ class AppState:
         if vl_session_id is not None and voice is not None:
             pass  # new-style call
         else:
-            from ..auth import DEFAULT_SESSION_ID
             # Old-style: session_id is actually vl_session_id, vl_session_id is voice, voice is model
             model = voice
             voice = vl_session_id  # type: ignore[assignment]
@@ -216,7 +222,6 @@ class AppState:
 
     async def end_voicelive(self, session_id: str | None = None, reason: str | None = None) -> None:
         if session_id is None:
-            from ..auth import DEFAULT_SESSION_ID
             session_id = DEFAULT_SESSION_ID
         vl = self._voicelive.get(session_id)
         if vl and vl.active:
@@ -231,7 +236,6 @@ class AppState:
     def snapshot(self, session_id: str | None = None) -> dict[str, Any]:
         """Return a serializable snapshot for a specific session."""
         if session_id is None:
-            from ..auth import DEFAULT_SESSION_ID
             session_id = DEFAULT_SESSION_ID
         call = self._calls.get(session_id)
         last = self._last_calls.get(session_id)
@@ -254,27 +258,23 @@ class AppState:
     @property
     def current_call(self) -> CallState | None:
         """Default session call — used by tests and un-migrated code."""
-        from ..auth import DEFAULT_SESSION_ID
         return self._calls.get(DEFAULT_SESSION_ID)
 
     @property
     def last_call(self) -> CallState | None:
-        from ..auth import DEFAULT_SESSION_ID
         return self._last_calls.get(DEFAULT_SESSION_ID)
 
     @property
-    def last_event_at(self) -> float | None:
-        from ..auth import DEFAULT_SESSION_ID
+    def last_event_monotonic(self) -> float | None:
+        """``time.monotonic()`` stamp, for idle durations only — not an epoch."""
         return self._last_events.get(DEFAULT_SESSION_ID)
 
     @property
     def voicelive(self) -> VoiceLiveState | None:
-        from ..auth import DEFAULT_SESSION_ID
         return self._voicelive.get(DEFAULT_SESSION_ID)
 
     @property
     def media(self) -> MediaMetrics:
-        from ..auth import DEFAULT_SESSION_ID
         return self.get_media(DEFAULT_SESSION_ID)
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
 
 from ..auth import get_session_id
@@ -64,9 +65,10 @@ async def hangup(request: Request):
 @router.post("/events", response_model=CallEventsResponse)
 async def call_events(request: Request):
     """ACS webhook receiver for call lifecycle events."""
+    raw = await request.body()
     try:
-        body = await request.json()
-    except Exception:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         raise HTTPException(400, "Invalid JSON")
 
     events = body if isinstance(body, list) else [body]
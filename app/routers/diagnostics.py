@@ -1,6 +1,8 @@
 """Diagnostic and health check routes."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import socket
 import ssl
@@ -16,6 +18,12 @@ from ..models.state import app_state
 logger = logging.getLogger("app.main")
 router = APIRouter(tags=["diagnostics"])
 
+# Successful TLS probe results are reused for this long, per host
+_PROBE_TTL_SEC = 60.0
+_probe_cache: dict[str, tuple[float, dict]] = {}
+# At most one probe in flight per host; concurrent callers share it
+_probe_inflight: dict[str, asyncio.Task] = {}
+
 
 @router.get("/health")
 async def health():
@@ -40,11 +48,16 @@ async def acs_health():
     return await _tls_probe(host)
 
 
+@functools.lru_cache(maxsize=1)
 def _parse_acs_host() -> str | None:
-    """Extract the hostname from the ACS connection string."""
+    """Extract the hostname from the ACS connection string.
+
+    Memoized: settings are frozen, so the answer never changes.
+    """
     for part in settings.acs_connection_string.split(";"):
-        if part.lower().startswith("endpoint="):
-            ep = part.split("=", 1)[1].strip()
+        key, _, value = part.partition("=")
+        if key.lower() == "endpoint":
+            ep = value.strip()
             if not ep.startswith("http"):
                 ep = "https://" + ep
             return urlparse(ep).hostname
@@ -52,20 +65,57 @@ def _parse_acs_host() -> str | None:
 
 
 async def _tls_probe(host: str, timeout: float = 5.0) -> dict:
-    """Perform a TLS handshake probe against an Azure endpoint."""
+    """Perform a TLS handshake probe against an Azure endpoint.
+
+    The probe blocks on DNS, TCP and TLS, so it runs in a worker thread.
+    Successful results are cached for ``_PROBE_TTL_SEC``; failures are
+    not, so a broken endpoint is re-checked on the next request.  Cached
+    answers carry ``cached: True`` and their ``age_ms``.  A burst of
+    requests on a cold cache shares a single probe.
+    """
+    cached = _probe_cache.get(host)
+    if cached:
+        age = time.monotonic() - cached[0]
+        if age < _PROBE_TTL_SEC:
+            # Marked so a replayed result isn't mistaken for a live handshake
+            return {**cached[1], "cached": True, "age_ms": int(age * 1000)}
+    task = _probe_inflight.get(host)
+    if task is None:
+        task = asyncio.ensure_future(_run_probe(host, timeout))
+        _probe_inflight[host] = task
+        task.add_done_callback(lambda _: _probe_inflight.pop(host, None))
+    # Shielded so one disconnecting caller doesn't cancel everyone's probe
+    return await asyncio.shield(task)
+
+
+async def _run_probe(host: str, timeout: float) -> dict:
+    """Run one probe and cache it if it succeeded."""
+    result = await asyncio.to_thread(_tls_probe_sync, host, timeout)
+    if result["ok"]:
+        _probe_cache[host] = (time.monotonic(), result)
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Default client context, built once: loading the CA store is not free."""
+    return ssl.create_default_context()
+
+
+def _tls_probe_sync(host: str, timeout: float) -> dict:
+    """Blocking body of ``_tls_probe``."""
     result: dict = {"host": host}
     try:
-        t0 = time.time()
+        t0 = time.perf_counter()
         addr_info = socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
         result["dns_records"] = [ai[4][0] for ai in addr_info[:5]]
         sock = socket.create_connection((host, 443), timeout=timeout)
-        ctx = ssl.create_default_context()
-        with ctx.wrap_socket(sock, server_hostname=host) as ssock:
+        with _ssl_context().wrap_socket(sock, server_hostname=host) as ssock:
             result["cipher"] = ssock.cipher()
             result["tls_version"] = ssock.version()
             cert = ssock.getpeercert()
             result["cert_notAfter"] = cert.get("notAfter")
-        result["elapsed_ms"] = int((time.time() - t0) * 1000)
+        result["elapsed_ms"] = int((time.perf_counter() - t0) * 1000)
         result["ok"] = True
     except Exception as exc:
         result["ok"] = False
@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 
+import orjson
 from fastapi import APIRouter, WebSocket
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
@@ -63,7 +64,8 @@ async def diagnostics_ws(ws: WebSocket) -> None:
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
                 if ws.application_state != WebSocketState.CONNECTED:
                     break
-                await ws.send_text(json.dumps(event.to_dict()))
+                # Hot during calls (RMS levels, transcripts): encode with orjson
+                await ws.send_text(orjson.dumps(event.to_dict()).decode())
             except asyncio.TimeoutError:
                 # Send keepalive ping to detect dead connections
                 try:
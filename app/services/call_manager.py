@@ -30,6 +30,8 @@ from ..services.event_bus import event_bus, EventType
 
 logger = logging.getLogger("app.call")
 
+_acs_client_instance: CallAutomationClient | None = None
+
 
 class CallManager:
     """Service that orchestrates call lifecycle across sessions.
@@ -154,11 +156,8 @@ class CallManager:
         if event_type.endswith("CallConnected"):
             session = self._sessions.get(session_id)
             if session and not session.active:
-                prompt = (
-                    app_state.get_call(session_id).prompt
-                    if app_state.get_call(session_id)
-                    else settings.default_system_prompt
-                )
+                call = app_state.get_call(session_id)
+                prompt = call.prompt if call else settings.default_system_prompt
                 try:
                     await asyncio.wait_for(
                         session.start(prompt), timeout=30.0
@@ -172,8 +171,7 @@ class CallManager:
                 try:
                     client = self._acs_client()
                     conn = client.get_call_connection(call_id)
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(None, conn.start_media_streaming)
+                    await asyncio.to_thread(conn.start_media_streaming)
                 except Exception as exc:
                     logger.warning("start_media_streaming failed: %s", exc)
 
@@ -181,14 +179,11 @@ class CallManager:
             if settings.enable_call_recording:
                 try:
                     client = self._acs_client()
-                    loop = asyncio.get_running_loop()
                     server_call_id = data.get("serverCallId")
                     if server_call_id:
-                        recording_resp = await loop.run_in_executor(
-                            None,
-                            lambda: client.start_recording(
-                                call_locator=ServerCallLocator(server_call_id),
-                            ),
+                        recording_resp = await asyncio.to_thread(
+                            client.start_recording,
+                            call_locator=ServerCallLocator(server_call_id),
                         )
                         rec_id = getattr(recording_resp, "recording_id", None)
                         if rec_id:
@@ -221,10 +216,7 @@ class CallManager:
             try:
                 client = self._acs_client()
                 conn = client.get_call_connection(actual_id)
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None, lambda: conn.hang_up(is_for_everyone=True)
-                )
+                await asyncio.to_thread(conn.hang_up, is_for_everyone=True)
             except Exception:
                 logger.debug("ACS hangup failed (continuing)")
 
@@ -233,10 +225,7 @@ class CallManager:
         if rec_id:
             try:
                 client = self._acs_client()
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None, lambda: client.stop_recording(rec_id)
-                )
+                await asyncio.to_thread(client.stop_recording, rec_id)
                 logger.info("Recording stopped recording_id=%s", rec_id)
             except Exception as exc:
                 logger.warning("Failed to stop recording: %s", exc)
@@ -290,7 +279,6 @@ class CallManager:
         )
 
         client = self._acs_client()
-        loop = asyncio.get_running_loop()
 
         def _do_create():
             return client.create_call(
@@ -304,7 +292,7 @@ class CallManager:
             )
 
         try:
-            resp = await loop.run_in_executor(None, _do_create)
+            resp = await asyncio.to_thread(_do_create)
         except AzureError as exc:
             logger.exception("ACS create_call failed: %s", exc)
             raise RuntimeError("ACS call creation failed") from exc
@@ -318,6 +306,19 @@ class CallManager:
 
         return call_id
 
+    async def warm_up(self) -> None:
+        """Open the pooled ACS HTTPS connection ahead of the first call.
+
+        Fetches properties of a call connection that does not exist; the
+        404 is expected and ignored — the point is that the TCP+TLS session
+        is left in the client's pool for the first ``create_call``.
+        """
+        try:
+            conn = self._acs_client().get_call_connection("warmup")
+            await asyncio.to_thread(conn.get_call_properties)
+        except Exception as exc:
+            logger.debug("ACS warm-up request finished: %s", exc)
+
     async def _watch_hangup_future(self, session_id: str, call_id: str) -> None:
         """Wait for the hangup future and end the call when triggered."""
         try:
@@ -334,9 +335,18 @@ class CallManager:
 
     @staticmethod
     def _acs_client() -> CallAutomationClient:
-        return CallAutomationClient.from_connection_string(
-            settings.acs_connection_string
-        )
+        """Return the process-wide ACS client, creating it on first use.
+
+        The SDK client is thread-safe and owns the HTTP pipeline and
+        connection pool, so one instance serves every call and keeps TLS
+        sessions warm between create, hangup and recording requests.
+        """
+        global _acs_client_instance
+        if _acs_client_instance is None:
+            _acs_client_instance = CallAutomationClient.from_connection_string(
+                settings.acs_connection_string
+            )
+        return _acs_client_instance
 
 
 # Module-level singleton
@@ -2,7 +2,7 @@
 
 A CallSession is created when a call starts and destroyed when it ends.
 It encapsulates the SpeechService, tracks call state in AppState, and
-runs a timeout watcher that auto-hangs-up on expiry.
+arms loop timers that auto-hang-up on hard or idle timeout.
 """
 from __future__ import annotations
 
@@ -22,7 +22,7 @@ class CallSession:
     """Encapsulates a single call's lifecycle.
 
     Created by CallManager on call start, destroyed on call end.
-    Owns the SpeechService and timeout watcher for this call.
+    Owns the SpeechService and timeout timers for this call.
     """
 
     def __init__(self, call_id: str, app_state: AppState, session_id: str) -> None:
@@ -30,7 +30,8 @@ class CallSession:
         self.session_id = session_id
         self._app_state = app_state
         self.speech: SpeechService = SpeechService(auth_session_id=session_id)
-        self._timeout_task: asyncio.Task | None = None
+        self._hard_timer: asyncio.TimerHandle | None = None
+        self._idle_timer: asyncio.TimerHandle | None = None
         self._hangup_callback: asyncio.Future | None = None
 
     @property
@@ -38,7 +39,7 @@ class CallSession:
         return self.speech.active
 
     async def start(self, system_prompt: str | None = None) -> None:
-        """Connect to Voice Live and start the timeout watcher."""
+        """Connect to Voice Live and arm the timeout timers."""
         await self.speech.connect(system_prompt)
         # Record Voice Live session in app state
         await self._app_state.begin_voicelive(
@@ -48,8 +49,7 @@ class CallSession:
             self.speech.model,
         )
         event_bus.emit(EventType.VL_SESSION_STARTED, session_id=self.session_id, call_id=self.call_id, vl_session_id=self.speech.session_id)
-        # Start timeout watcher
-        self._timeout_task = asyncio.create_task(self._watch_timeouts())
+        self._arm_timeouts()
         logger.info(
             "CallSession started call_id=%s speech_id=%s session_id=%s",
             self.call_id,
@@ -58,14 +58,8 @@ class CallSession:
         )
 
     async def stop(self, reason: str | None = None) -> None:
-        """Tear down speech session and cancel timeout watcher."""
-        if self._timeout_task:
-            self._timeout_task.cancel()
-            try:
-                await self._timeout_task
-            except (asyncio.CancelledError, Exception):
-                pass
-            self._timeout_task = None
+        """Tear down speech session and cancel timeout timers."""
+        self._cancel_timeouts()
 
         if self.speech.active:
             await self.speech.close()
@@ -78,45 +72,71 @@ class CallSession:
         )
 
     def set_hangup_callback(self, callback: asyncio.Future) -> None:
-        """Register a future that the timeout watcher can signal for auto-hangup.
+        """Register a future that the timeout timers can signal for auto-hangup.
 
         The CallManager provides this so the session can request a hangup
         without knowing about ACS directly.
         """
         self._hangup_callback = callback
 
-    async def _watch_timeouts(self) -> None:
-        """Background task: check call duration and idle time every 5 seconds."""
-        try:
-            while True:
-                await asyncio.sleep(5)
-
-                call = self._app_state.get_call(self.session_id)
-                if not call:
-                    break
-
-                elapsed = time.time() - call.started_at
-
-                # Hard timeout
-                if elapsed > settings.call_timeout_sec:
-                    logger.info(
-                        "Call timeout after %.0fs call_id=%s",
-                        elapsed,
-                        self.call_id,
-                    )
-                    if self._hangup_callback and not self._hangup_callback.done():
-                        self._hangup_callback.set_result("Timeout")
-                    break
-
-                # Idle timeout
-                last_event = self._app_state.get_last_event(self.session_id)
-                if last_event and (time.time() - last_event) > settings.call_idle_timeout_sec:
-                    logger.info("Call idle timeout call_id=%s", self.call_id)
-                    if self._hangup_callback and not self._hangup_callback.done():
-                        self._hangup_callback.set_result("Idle")
-                    break
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as exc:
-            logger.debug("timeout watcher error: %s", exc)
+    def _arm_timeouts(self) -> None:
+        """Schedule the hard and idle timeout checks with ``loop.call_later``.
+
+        Replaces a 5-second polling task: the loop wakes only at the
+        deadlines, and fires on time instead of up to 5s late.
+        """
+        self._cancel_timeouts()
+        loop = asyncio.get_running_loop()
+        call = self._app_state.get_call(self.session_id)
+        elapsed = time.time() - call.started_at if call else 0.0
+        self._hard_timer = loop.call_later(
+            max(0.0, settings.call_timeout_sec - elapsed), self._on_hard_timeout
+        )
+        self._idle_timer = loop.call_later(settings.call_idle_timeout_sec, self._on_idle_deadline)
+
+    def _cancel_timeouts(self) -> None:
+        for timer in (self._hard_timer, self._idle_timer):
+            if timer:
+                timer.cancel()
+        self._hard_timer = self._idle_timer = None
+
+    def _on_hard_timeout(self) -> None:
+        self._hard_timer = None
+        call = self._app_state.get_call(self.session_id)
+        if not call:
+            return
+        logger.info(
+            "Call timeout after %.0fs call_id=%s",
+            time.time() - call.started_at,
+            self.call_id,
+        )
+        self._request_hangup("Timeout")
+
+    def _on_idle_deadline(self) -> None:
+        """Idle deadline reached — re-arm if activity moved it, else hang up.
+
+        Audio and webhook activity only bump ``last_event`` in AppState;
+        the timer is re-armed lazily here so per-frame updates never touch
+        the loop's timer heap.
+        """
+        self._idle_timer = None
+        if not self._app_state.get_call(self.session_id):
+            return
+        last_event = self._app_state.get_last_event(self.session_id)
+        remaining = (
+            settings.call_idle_timeout_sec - (time.monotonic() - last_event)
+            if last_event
+            else settings.call_idle_timeout_sec
+        )
+        if remaining > 0:
+            self._idle_timer = asyncio.get_running_loop().call_later(
+                remaining, self._on_idle_deadline
+            )
+            return
+        logger.info("Call idle timeout call_id=%s", self.call_id)
+        self._request_hangup("Idle")
+
+    def _request_hangup(self, reason: str) -> None:
+        self._cancel_timeouts()
+        if self._hangup_callback and not self._hangup_callback.done():
+            self._hangup_callback.set_result(reason)
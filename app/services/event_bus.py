@@ -112,6 +112,10 @@ class EventBus:
         dropped so the bus never blocks the publisher.
         Subscribers with a session_id filter only receive matching events.
         """
+        self._deliver(event)
+
+    def _deliver(self, event: DiagnosticEvent) -> None:
+        """Synchronous body of ``publish`` — never awaits, never blocks."""
         self._recent.append(event)
         if len(self._recent) > self._recent_max:
             # Trim from the front — keep the newest events
@@ -136,18 +140,13 @@ class EventBus:
             self._subscribers.pop(sub_id, None)
 
     def emit(self, event_type: EventType, session_id: str = "default", **data: Any) -> None:
-        """Fire-and-forget helper for sync call-sites inside the loop.
+        """Fire-and-forget helper for sync call-sites.
 
-        Creates an ``asyncio.Task`` internally. In pure-async code prefer
-        ``await publish()`` directly so back-pressure is visible.
+        Delivers inline: fan-out is a handful of ``put_nowait`` calls, so
+        scheduling a Task per event (hundreds per call) would cost more
+        than the work itself.
         """
-        event = DiagnosticEvent(type=event_type, data=data, session_id=session_id)
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.publish(event))
-        except RuntimeError:
-            # No event loop running — skip (happens during import/tests)
-            pass
+        self._deliver(DiagnosticEvent(type=event_type, data=data, session_id=session_id))
 
     def get_recent(self, session_id: str | None = None) -> list[dict[str, Any]]:
         """Return recent events, optionally filtered by session_id."""
@@ -9,14 +9,22 @@ and AppState via the handle_media_ws() function parameters.
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
 import logging
 import time
 
+import orjson
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
+try:
+    # SIMD codec; ~5x faster than stdlib either way on a 960-byte frame
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    from base64 import b64decode, b64encode
+
+    def b64encode_as_string(s: bytes) -> str:
+        return b64encode(s).decode("ascii")
+
 from ..config import settings
 from ..models.state import AppState
 
@@ -24,6 +32,17 @@ logger = logging.getLogger("app.media")
 
 FRAME_BYTES = settings.media_frame_bytes
 
+# Sent once on accept to unlock the ACS audio stream.  Kept a text frame:
+# ACS media messages are JSON text, and a binary ack would be read as PCM.
+_ACK = '{"type":"ack"}'
+
+# Message kinds whose top-level ``data`` field carries base64 PCM
+_AUDIO_KINDS = frozenset({"AudioData", "AudioChunk"})
+
+# Fixed ACS outbound envelope: {"kind":"AudioData","audioData":{"data":"<b64>"}}
+_AUDIO_PREFIX = '{"kind":"AudioData","audioData":{"data":"'
+_AUDIO_SUFFIX = '"}}'
+
 
 async def handle_media_ws(
     ws: WebSocket,
@@ -49,10 +68,9 @@ async def handle_media_ws(
     subproto = offered.split(",")[0].strip() if offered else None
     await ws.accept(subprotocol=subproto)
 
-    # Send ack to unlock ACS audio stream
     try:
         if ws.application_state == WebSocketState.CONNECTED:
-            await ws.send_text('{"type":"ack"}')
+            await ws.send_text(_ACK)
     except Exception as exc:
         logger.warning("ack send failed token=%s session=%s: %s", token, session_id, exc)
         return
@@ -64,7 +82,15 @@ async def handle_media_ws(
 
     # Concurrent outbound loop (Voice Live → ACS) with wall-clock-aligned timing
     async def outbound_loop() -> None:
+        # Raw ASGI send: after accept() the socket stays CONNECTED for the
+        # life of this loop, so Starlette's per-call state checks are
+        # redundant at 50 frames/sec.  Send errors still end the loop.
+        send = ws._send
+        # Settings are frozen for the process; read once outside the loop
         interval = settings.media_frame_interval_ms / 1000.0
+        if not settings.media_enable_voicelive_out:
+            # Nothing will ever be sent; don't tick 50 times a second for it
+            return
         loop = asyncio.get_running_loop()
         next_send = loop.time()
         while True:
@@ -73,20 +99,23 @@ async def handle_media_ws(
             delay = next_send - now
             if delay > 0:
                 await asyncio.sleep(delay)
-            elif delay < -1.0:
-                # Clock jumped or massive lag — reset to avoid burst-sending
+            elif delay < -interval:
+                # More than a frame behind (loop stall, clock jump) — re-anchor
+                # the schedule rather than burst the backlog at ACS
                 next_send = loop.time()
-                continue
             speech = get_speech()
-            if not (speech and speech.active and settings.media_enable_voicelive_out):
+            if not (speech and speech.active):
                 continue
             frame = await speech.get_next_output_frame()
             if not frame:
+                # Nothing to play: park until Voice Live queues audio rather
+                # than waking every tick, then send the first frame at once
+                await speech.wait_for_output()
+                next_send = loop.time() - interval
                 continue
+            payload = _encode_audio_frame(frame)
             try:
-                b64 = base64.b64encode(frame).decode("ascii")
-                payload = json.dumps({"kind": "AudioData", "audioData": {"data": b64}})
-                await ws.send_text(payload)
+                await send({"type": "websocket.send", "text": payload})
                 app_state.get_media(session_id).record_outbound(1, len(frame))
             except Exception as exc:
                 logger.debug("outbound send error session=%s: %s", session_id, exc)
@@ -94,26 +123,29 @@ async def handle_media_ws(
 
     outbound_task = asyncio.create_task(outbound_loop())
 
-    # Inbound loop (ACS → Voice Live)
+    # Inbound loop (ACS → Voice Live).  Raw ASGI receive for the same reason
+    # as the outbound send: the socket is CONNECTED until the disconnect
+    # message below, so Starlette's state-machine checks add nothing.
+    receive = ws._receive
+    vl_in = settings.media_enable_voicelive_in
+    residual = b""  # partial frame carried over to the next message
     try:
         while True:
-            speech = get_speech()
-            incoming = await ws.receive()
+            incoming = await receive()
 
-            if incoming.get("type") == "websocket.disconnect":
+            if incoming["type"] == "websocket.disconnect":
+                ws.client_state = WebSocketState.DISCONNECTED
                 break
 
-            text = incoming.get("text")
-            raw_bytes = incoming.get("bytes")
-
-            if text:
-                pcm = _extract_pcm_from_json(text)
-                if pcm:
-                    await _forward_inbound(pcm, speech, app_state, session_id)
-                continue
+            # Resolved after the await so a session started meanwhile is seen
+            speech = get_speech() if vl_in else None
 
-            if raw_bytes:
-                await _forward_inbound(raw_bytes, speech, app_state, session_id)
+            text = incoming.get("text")
+            pcm = _extract_pcm_from_json(text) if text else incoming.get("bytes")
+            if pcm:
+                if residual:
+                    pcm = residual + pcm
+                residual = await _forward_inbound(pcm, speech, app_state, session_id)
 
     except Exception as exc:
         logger.debug("media ws loop error token=%s session=%s: %s", token, session_id, exc)
@@ -126,10 +158,40 @@ async def handle_media_ws(
         logger.info("MEDIA closed token=%s session=%s", token, session_id)
 
 
+def _encode_audio_frame(frame: bytes) -> str:
+    """Wrap one PCM frame in the ACS ``AudioData`` JSON envelope.
+
+    Called once per outbound frame.  The envelope shape is fixed and base64
+    output never needs JSON escaping, so a string template replaces
+    ``json.dumps``.
+    """
+    return _AUDIO_PREFIX + b64encode_as_string(frame) + _AUDIO_SUFFIX
+
+
 def _extract_pcm_from_json(text: str) -> bytes | None:
-    """Parse ACS JSON message and extract PCM audio bytes."""
+    """Parse ACS JSON message and extract PCM audio bytes.
+
+    ACS sends compact JSON, so for audio frames the base64 body is sliced
+    straight out of the text and metadata is dropped unparsed; anything
+    else (whitespace, escaped characters) takes the full parse below.
+    """
+    if '"AudioData"' in text or '"AudioChunk"' in text:
+        start = text.find('"data":"')
+        if start >= 0:
+            start += 8
+            end = text.find('"', start)
+            if end > start:
+                b64 = text[start:end]
+                if "\\" not in b64:
+                    try:
+                        return b64decode(b64)
+                    except Exception:
+                        return None
+    elif '"AudioMetadata"' in text:
+        return None
+
     try:
-        parsed = json.loads(text)
+        parsed = orjson.loads(text)
     except Exception:
         return None
 
@@ -142,12 +204,12 @@ def _extract_pcm_from_json(text: str) -> bytes | None:
     audio_data = parsed.get("audioData")
     if isinstance(audio_data, dict) and isinstance(audio_data.get("data"), str):
         b64 = audio_data["data"]
-    elif isinstance(parsed.get("data"), str) and kind in {"AudioData", "AudioChunk"}:
+    elif isinstance(parsed.get("data"), str) and kind in _AUDIO_KINDS:
         b64 = parsed["data"]
 
     if b64:
         try:
-            return base64.b64decode(b64)
+            return b64decode(b64)
         except Exception:
             return None
     return None
@@ -158,24 +220,29 @@ async def _forward_inbound(
     speech,  # SpeechService | None
     app_state: AppState,
     session_id: str = "default",
-) -> None:
-    """Slice PCM into frames and forward to Voice Live."""
-    if not pcm:
-        return
+) -> bytes:
+    """Forward the whole frames in *pcm* to Voice Live.
 
+    Callers pass ``speech=None`` when Voice Live input is disabled; metrics
+    and the idle timer are still updated.
+
+    Returns:
+        The trailing partial frame, for the caller to prepend to the next
+        message so fragmented deliveries lose no audio.
+    """
     frame_count = len(pcm) // FRAME_BYTES
-    if frame_count:
-        app_state.get_media(session_id).record_inbound(frame_count, len(pcm))
-        app_state.update_last_event(session_id)  # Keep idle timer alive during audio flow
+    aligned = frame_count * FRAME_BYTES
+    if not frame_count:
+        return pcm
 
-    if not (speech and speech.active and settings.media_enable_voicelive_in):
-        return
+    app_state.get_media(session_id).record_inbound(frame_count, aligned)
+    app_state.update_last_event(session_id)  # Keep idle timer alive during audio flow
 
-    # Send each frame individually to Voice Live
-    for offset in range(0, frame_count * FRAME_BYTES, FRAME_BYTES):
-        frame = pcm[offset : offset + FRAME_BYTES]
+    if speech and speech.active:
+        # One append per message: Voice Live takes any whole number of
+        # frames, and for the usual single-frame message this is ``pcm``.
         try:
-            await speech.send_audio(frame)
+            await speech.send_audio(pcm[:aligned])
         except Exception as exc:
             logger.debug("speech frame send error: %s", exc)
-            break
+    return pcm[aligned:]
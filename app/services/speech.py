@@ -4,6 +4,7 @@ Provides a clean async interface for the media bridge:
     - connect(system_prompt, tools) → establishes Voice Live WebSocket session
     - send_audio(pcm_bytes) → streams caller audio to Voice Live
     - get_next_output_frame() → returns next synthesized audio frame (or None)
+    - wait_for_output() → parks until output audio is queued
     - close() → tears down session
 
 Both ACS and Voice Live now operate at 24kHz — no resampling needed.
@@ -18,7 +19,7 @@ import asyncio
 import logging
 import uuid
 from collections import deque
-from typing import Any, Deque
+from typing import Any
 
 from azure.core.credentials import AzureKeyCredential
 
@@ -62,6 +63,15 @@ try:
         AudioNoiseReduction,
     )
 
+    # Bound once: member access on the SDK's case-insensitive enum goes
+    # through a metaclass lookup, which adds up across every audio delta.
+    _EV_SESSION_UPDATED = ServerEventType.SESSION_UPDATED
+    _EV_AUDIO_DELTA = ServerEventType.RESPONSE_AUDIO_DELTA
+    _EV_SPEECH_STARTED = ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED
+    _EV_ERROR = ServerEventType.ERROR
+    _EV_USER_TRANSCRIPT = ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED
+    _EV_AGENT_TRANSCRIPT = ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE
+
     VOICELIVE_AVAILABLE = True
 except ImportError:
     VOICELIVE_AVAILABLE = False
@@ -83,8 +93,11 @@ class SpeechService:
         self._connection: Any = None
         self._session_ready = asyncio.Event()
         self._event_task: asyncio.Task | None = None
-        self._output_queue: Deque[bytes] = deque(maxlen=2000)
+        self._output_queue: deque[bytes] = deque(maxlen=2000)
         self._output_buffer = bytearray()
+        # Set while _output_queue may hold frames; lets the pacer park
+        # instead of polling an empty queue every 20ms
+        self._output_ready = asyncio.Event()
         self._inbound_frame_count: int = 0
 
     @property
@@ -182,6 +195,7 @@ class SpeechService:
         """Stream raw PCM audio from caller to Voice Live input buffer.
 
         Both ACS and Voice Live operate at 24kHz — no resampling needed.
+        May carry several 20ms frames in one call; metrics count frames.
 
         Args:
             pcm_bytes: Raw 16-bit PCM audio bytes at 24kHz from the caller.
@@ -190,10 +204,11 @@ class SpeechService:
             return
         try:
             await self._connection.input_audio_buffer.append(audio=pcm_bytes)
-            self._inbound_frame_count += 1
+            prev = self._inbound_frame_count
+            self._inbound_frame_count += max(1, len(pcm_bytes) // FRAME_BYTES)
             # Emit RMS for waveform visualization every 5 frames (~100ms)
-            if self._inbound_frame_count % 5 == 0:
-                rms = _calculate_rms(pcm_bytes)
+            if prev // 5 != self._inbound_frame_count // 5:
+                rms = _calculate_rms(pcm_bytes[-FRAME_BYTES:])
                 event_bus.emit(EventType.AUDIO_RMS, session_id=self._auth_session_id, channel="caller", rms=rms, vl_session_id=self.session_id)
             if self._inbound_frame_count >= 50:
                 event_bus.emit(EventType.AUDIO_INBOUND, session_id=self._auth_session_id, frames=self._inbound_frame_count, vl_session_id=self.session_id)
@@ -208,11 +223,17 @@ class SpeechService:
         try:
             return self._output_queue.popleft()
         except IndexError:
+            self._output_ready.clear()
             return None
 
+    async def wait_for_output(self) -> None:
+        """Block until output audio is queued or the session closes."""
+        await self._output_ready.wait()
+
     async def close(self) -> None:
         """Tear down the Voice Live session."""
         self._active = False
+        self._output_ready.set()  # release a parked pacer
         if self._event_task:
             self._event_task.cancel()
             try:
@@ -258,43 +279,47 @@ class SpeechService:
 
     async def _consume_events(self) -> None:
         """Async iterator over Voice Live server events."""
+        # Level is fixed once logging is configured; check it once per
+        # session instead of on every audio delta.
+        trace_events = logger.isEnabledFor(logging.DEBUG)
         try:
             async for event in self._connection:
                 etype = getattr(event, "type", None)
-                logger.debug("voicelive event type=%s", etype)
+                if trace_events:
+                    logger.debug("voicelive event type=%s", etype)
 
-                if etype == ServerEventType.SESSION_UPDATED:
+                if etype == _EV_SESSION_UPDATED:
                     self._session_ready.set()
                     event_bus.emit(EventType.VL_SESSION_READY, session_id=self._auth_session_id, vl_session_id=self.session_id)
                     logger.info("Voice Live session ready")
 
-                elif etype == ServerEventType.RESPONSE_AUDIO_DELTA:
+                elif etype == _EV_AUDIO_DELTA:
                     delta = getattr(event, "delta", None)
                     if delta:
                         self._buffer_output_audio(delta)
                         event_bus.emit(EventType.AUDIO_OUTBOUND, session_id=self._auth_session_id, frames=len(delta), vl_session_id=self.session_id)
 
-                elif etype == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
+                elif etype == _EV_SPEECH_STARTED:
                     # Barge-in: user started speaking, clear queued output
                     self._output_queue.clear()
                     self._output_buffer.clear()
                     event_bus.emit(EventType.BARGE_IN, session_id=self._auth_session_id, vl_session_id=self.session_id)
                     logger.debug("barge-in: cleared output queue")
 
-                elif etype == ServerEventType.ERROR:
+                elif etype == _EV_ERROR:
                     error = getattr(event, "error", None)
                     event_bus.emit(EventType.VL_ERROR, session_id=self._auth_session_id, message=str(getattr(error, "message", error)), vl_session_id=self.session_id)
                     logger.error(
                         "Voice Live error: %s", getattr(error, "message", error)
                     )
 
-                elif etype == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED:
+                elif etype == _EV_USER_TRANSCRIPT:
                     transcript = getattr(event, "transcript", "")
                     if transcript:
                         event_bus.emit(EventType.TRANSCRIPT_USER, session_id=self._auth_session_id, text=transcript, vl_session_id=self.session_id)
                         call_history.add_transcript_turn("user", transcript)
 
-                elif etype == ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE:
+                elif etype == _EV_AGENT_TRANSCRIPT:
                     transcript = getattr(event, "transcript", "")
                     if transcript:
                         event_bus.emit(EventType.TRANSCRIPT_AGENT, session_id=self._auth_session_id, text=transcript, vl_session_id=self.session_id)
@@ -312,14 +337,24 @@ class SpeechService:
         frames at 24kHz (960 bytes) and queue directly — both sides now
         operate at 24kHz so no resampling is needed.
         """
-        self._output_buffer.extend(audio_bytes)
-        while len(self._output_buffer) >= FRAME_BYTES:
-            frame = bytes(self._output_buffer[:FRAME_BYTES])
-            del self._output_buffer[:FRAME_BYTES]
-            if len(self._output_queue) == self._output_queue.maxlen:
-                self._output_queue.popleft()
-                logger.debug("output queue full — dropped oldest frame")
-            self._output_queue.append(frame)
-            # Emit RMS for agent waveform
-            rms = _calculate_rms(frame)
-            event_bus.emit(EventType.AUDIO_RMS, session_id=self._auth_session_id, channel="agent", rms=rms, vl_session_id=self.session_id)
+        buf = self._output_buffer
+        buf.extend(audio_bytes)
+        aligned = len(buf) // FRAME_BYTES * FRAME_BYTES
+        if not aligned:
+            return
+        queue = self._output_queue
+        # Copy frames straight out of a view (one copy each, not slice + bytes)
+        # and trim the consumed prefix once per delta
+        with memoryview(buf) as view:
+            for offset in range(0, aligned, FRAME_BYTES):
+                frame = view[offset : offset + FRAME_BYTES].tobytes()
+                if len(queue) == queue.maxlen:
+                    queue.popleft()
+                    logger.debug("output queue full — dropped oldest frame")
+                queue.append(frame)
+        del buf[:aligned]
+        self._output_ready.set()
+        # Emit RMS for agent waveform once per delta: deltas arrive faster
+        # than real time, so per-frame levels would only overwrite each other
+        rms = _calculate_rms(frame)
+        event_bus.emit(EventType.AUDIO_RMS, session_id=self._auth_session_id, channel="agent", rms=rms, vl_session_id=self.session_id)
@@ -0,0 +1,29 @@
+"""Tests for the POST /call/events ACS webhook receiver."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+
+def test_call_events_rejects_invalid_json(client):
+    """A non-JSON body returns 400."""
+    resp = client.post("/call/events", content=b"{not json", headers={"content-type": "application/json"})
+    assert resp.status_code == 400
+
+
+def test_call_events_dispatches_batch(client):
+    """Each well-formed event in a batch is forwarded to the CallManager."""
+    events = [
+        {"type": "Microsoft.Communication.CallConnected", "data": {"callConnectionId": "c-1"}},
+        {"type": "Microsoft.Communication.CallDisconnected", "data": {"callConnectionId": "c-1"}},
+        {"type": "Microsoft.Communication.CallConnected", "data": {}},  # no call id — skipped
+    ]
+    with patch(
+        "app.services.call_manager.CallManager.handle_event", new_callable=AsyncMock
+    ) as handle:
+        resp = client.post("/call/events", json=events)
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["processed"] == 3
+    assert data["ended"] == ["Microsoft.Communication.CallDisconnected"]
+    assert handle.await_count == 2
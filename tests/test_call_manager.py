@@ -132,3 +132,31 @@ async def test_concurrent_sessions_independent(cm):
 
     # Cleanup remaining session
     cm._sessions.pop("s2", None)
+
+
+# ── 6. ACS client is created once per process ────────────────────────
+
+
+def test_acs_client_is_cached(monkeypatch):
+    """_acs_client builds the SDK client once and reuses it."""
+    import app.services.call_manager as cm_mod
+
+    monkeypatch.setattr(cm_mod, "_acs_client_instance", None)
+    with patch.object(
+        cm_mod.CallAutomationClient, "from_connection_string", return_value=MagicMock()
+    ) as factory:
+        first = CallManager._acs_client()
+        second = CallManager._acs_client()
+
+    assert first is second
+    factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_swallows_expected_not_found(cm):
+    """The warm-up request's 404 (or any error) never escapes."""
+    client = MagicMock()
+    client.get_call_connection.return_value.get_call_properties.side_effect = RuntimeError("404")
+    with patch.object(CallManager, "_acs_client", return_value=client):
+        await cm.warm_up()
+    client.get_call_connection.assert_called_once_with("warmup")
@@ -0,0 +1,68 @@
+"""Tests for CallSession timeout timers."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+
+import pytest
+
+from app.models.state import AppState
+from app.services import call_session as call_session_mod
+from app.services.call_session import CallSession
+
+
+@pytest.fixture
+def timeouts(monkeypatch):
+    """Patch call/idle timeouts on the settings seen by CallSession."""
+    def _apply(call_timeout: int, idle_timeout: int) -> None:
+        patched = dataclasses.replace(
+            call_session_mod.settings,
+            call_timeout_sec=call_timeout,
+            call_idle_timeout_sec=idle_timeout,
+        )
+        monkeypatch.setattr(call_session_mod, "settings", patched)
+    return _apply
+
+
+async def _armed_session(state: AppState) -> tuple[CallSession, asyncio.Future]:
+    await state.begin_call("s1", "call-1", "prompt")
+    session = CallSession("call-1", state, "s1")
+    future = asyncio.get_running_loop().create_future()
+    session.set_hangup_callback(future)
+    session._arm_timeouts()
+    return session, future
+
+
+@pytest.mark.asyncio
+async def test_hard_timeout_requests_hangup(timeouts):
+    """An expired hard timeout resolves the hangup future with 'Timeout'."""
+    timeouts(call_timeout=0, idle_timeout=300)
+    session, future = await _armed_session(AppState())
+
+    assert await asyncio.wait_for(future, timeout=1.0) == "Timeout"
+    assert session._idle_timer is None
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_requests_hangup(timeouts):
+    """No activity past the idle window resolves the future with 'Idle'."""
+    timeouts(call_timeout=300, idle_timeout=0)
+    state = AppState()
+    session, future = await _armed_session(state)
+    state._last_events["s1"] = time.monotonic() - 1
+
+    assert await asyncio.wait_for(future, timeout=1.0) == "Idle"
+
+
+@pytest.mark.asyncio
+async def test_idle_deadline_rearms_on_recent_activity(timeouts):
+    """Recent activity pushes the idle check out instead of hanging up."""
+    timeouts(call_timeout=300, idle_timeout=300)
+    session, future = await _armed_session(AppState())
+
+    session._on_idle_deadline()
+
+    assert not future.done()
+    assert session._idle_timer is not None
+    session._cancel_timeouts()
@@ -0,0 +1,153 @@
+"""Tests for Settings construction and validation."""
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from app.config import Settings, settings
+
+
+def _required(**overrides) -> dict:
+    base = {
+        "app_base_url": "https://example.test",
+        "acs_connection_string": "endpoint=https://acs.test/;accesskey=eA==",
+        "acs_outbound_caller_id": "+10000000000",
+    }
+    base.update(overrides)
+    return base
+
+
+def test_settings_is_frozen():
+    """Loaded settings are read-only for the process lifetime."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.log_level = "DEBUG"  # type: ignore[misc]
+
+
+def test_required_field_blank_raises():
+    """Blank core ACS values are rejected by validate()."""
+    s = Settings(**_required(acs_outbound_caller_id="  "))
+    with pytest.raises(ValueError):
+        s.validate()
+
+
+def test_defaults_applied():
+    """Optional fields fall back to their declared defaults."""
+    s = Settings(**_required())
+    assert s.media_frame_bytes == 960
+    assert s.voicelive_endpoint is None
+
+
+def test_load_settings_is_memoized():
+    """Repeat callers share one instance."""
+    from app.config import load_settings
+
+    assert load_settings() is load_settings()
+
+
+def test_load_settings_parses_env(monkeypatch):
+    """Env values are parsed through the field table; absent keys use defaults."""
+    from app.config import load_settings
+
+    monkeypatch.setenv("ACS_CONNECTION_STRING", "\"endpoint=https://acs.test/;accesskey=eA==\"")
+    monkeypatch.setenv("MEDIA_FRAME_BYTES", "640")
+    monkeypatch.setenv("MEDIA_BIDIRECTIONAL", "FALSE")
+    monkeypatch.setenv("MEDIA_AUDIO_CHANNEL_TYPE", "Unmixed")
+    monkeypatch.setenv("CALL_TIMEOUT_SEC", "90")
+    monkeypatch.delenv("CALL_IDLE_TIMEOUT_SEC", raising=False)
+    load_settings.cache_clear()
+    try:
+        s = load_settings()
+    finally:
+        load_settings.cache_clear()
+
+    assert s.acs_connection_string == "endpoint=https://acs.test/;accesskey=eA=="
+    assert s.media_frame_bytes == 640
+    assert s.media_bidirectional is False
+    assert s.media_audio_channel_type == "unmixed"
+    assert s.call_idle_timeout_sec == 90
+    assert s.voicelive_vad_threshold == 0.5
+
+
+def test_bool_parser_accepts_common_truthy_values():
+    """Boolean env vars accept true/1/yes/on in any case; anything else is False."""
+    from app.config import _bool
+
+    for raw in ("true", "TRUE", "1", "yes", " On "):
+        assert _bool(raw) is True
+    for raw in ("false", "0", "no", "", "enabled"):
+        assert _bool(raw) is False
+
+
+def test_env_flag_uses_bool_parser_and_default(monkeypatch):
+    """Process-level flags share the Settings truthy set; unset means default."""
+    from app.config import env_flag
+
+    monkeypatch.delenv("APP_TEST_FLAG", raising=False)
+    assert env_flag("APP_TEST_FLAG") is False
+    assert env_flag("APP_TEST_FLAG", default=True) is True
+    monkeypatch.setenv("APP_TEST_FLAG", "Yes")
+    assert env_flag("APP_TEST_FLAG") is True
+    monkeypatch.setenv("APP_TEST_FLAG", "0")
+    assert env_flag("APP_TEST_FLAG", default=True) is False
+
+
+def test_settings_attribute_is_cached_on_module():
+    """After first access the module attribute is a plain global."""
+    import app.config as config_mod
+
+    assert "settings" in vars(config_mod)
+    assert config_mod.settings is settings
+
+
+def test_validate_voicelive_lists_missing_fields():
+    """All missing Voice Live fields are reported together."""
+    s = Settings(**_required(voicelive_endpoint="https://vl.test", voicelive_model=None))
+    with pytest.raises(ValueError, match="VOICELIVE_MODEL, VOICELIVE_VOICE"):
+        s.validate_voicelive()
+
+
+def test_conn_str_strips_whitespace_and_quotes():
+    """Portal-copied connection strings lose surrounding quotes and whitespace."""
+    from app.config import _conn_str
+
+    assert _conn_str("  'endpoint=x;accesskey=y'\n") == "endpoint=x;accesskey=y"
+    assert _conn_str('"endpoint=x;accesskey=y"') == "endpoint=x;accesskey=y"
+    assert _conn_str("endpoint=x;accesskey=y==") == "endpoint=x;accesskey=y=="
+
+
+def test_idle_timeout_alias_precedence(monkeypatch):
+    """CALL_IDLE_TIMEOUT_SEC wins over its CALL_TIMEOUT_SEC fallback."""
+    from app.config import load_settings
+
+    monkeypatch.setenv("CALL_TIMEOUT_SEC", "90")
+    monkeypatch.setenv("CALL_IDLE_TIMEOUT_SEC", "45")
+    load_settings.cache_clear()
+    try:
+        s = load_settings()
+    finally:
+        load_settings.cache_clear()
+
+    assert s.call_timeout_sec == 90
+    assert s.call_idle_timeout_sec == 45
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"media_audio_channel_type": "stereo"}, "MEDIA_AUDIO_CHANNEL_TYPE"),
+        ({"voicelive_vad_threshold": 1.5}, "VOICELIVE_VAD_THRESHOLD"),
+        ({"voicelive_vad_prefix_padding_ms": 0}, "VOICELIVE_VAD_PREFIX_PADDING_MS"),
+        ({"voicelive_vad_silence_duration_ms": -1}, "VOICELIVE_VAD_SILENCE_DURATION_MS"),
+    ],
+)
+def test_validate_voicelive_range_checks(overrides, message):
+    """Each out-of-range Voice Live value raises with its env var name."""
+    s = Settings(**_required(
+        voicelive_endpoint="https://vl.test",
+        voicelive_model="gpt-realtime",
+        voicelive_voice="alloy",
+        **overrides,
+    ))
+    with pytest.raises(ValueError, match=message):
+        s.validate_voicelive()
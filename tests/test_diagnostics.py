@@ -0,0 +1,52 @@
+"""Tests for the ACS diagnostics helpers."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import app.routers.diagnostics as diag
+
+
+def test_parse_acs_host_from_connection_string():
+    """The endpoint host is extracted from the test connection string."""
+    assert diag._parse_acs_host() == "test.communication.azure.com"
+
+
+@pytest.mark.asyncio
+async def test_tls_probe_caches_success_only(monkeypatch):
+    """A successful probe is reused; a failed one is retried."""
+    calls: list[str] = []
+
+    def fake_probe(host: str, timeout: float) -> dict:
+        calls.append(host)
+        return {"host": host, "ok": host == "good.test"}
+
+    monkeypatch.setattr(diag, "_tls_probe_sync", fake_probe)
+    monkeypatch.setattr(diag, "_probe_cache", {})
+
+    first = await diag._tls_probe("good.test")
+    assert first["ok"] and "cached" not in first
+    second = await diag._tls_probe("good.test")
+    assert second["ok"] and second["cached"] is True and second["age_ms"] >= 0
+    await diag._tls_probe("bad.test")
+    await diag._tls_probe("bad.test")
+    assert calls == ["good.test", "bad.test", "bad.test"]
+
+
+@pytest.mark.asyncio
+async def test_tls_probe_concurrent_callers_share_one_probe(monkeypatch):
+    """Simultaneous requests on a cold cache trigger a single handshake."""
+    calls: list[str] = []
+
+    def fake_probe(host: str, timeout: float) -> dict:
+        calls.append(host)
+        return {"host": host, "ok": True}
+
+    monkeypatch.setattr(diag, "_tls_probe_sync", fake_probe)
+    monkeypatch.setattr(diag, "_probe_cache", {})
+    monkeypatch.setattr(diag, "_probe_inflight", {})
+
+    results = await asyncio.gather(*(diag._tls_probe("burst.test") for _ in range(5)))
+    assert all(r["ok"] for r in results)
+    assert calls == ["burst.test"]
@@ -109,3 +109,17 @@ async def test_recent_buffer_caps_at_max():
     # Should keep the newest events
     assert recent[0]["data"]["i"] == 5
     assert recent[-1]["data"]["i"] == 9
+
+
+def test_emit_delivers_inline():
+    """emit() reaches subscribers immediately, without awaiting."""
+    bus = EventBus()
+    sub_id, queue = bus.subscribe()
+
+    bus.emit(EventType.BARGE_IN, session_id="s1", vl_session_id="vl-1")
+
+    event = queue.get_nowait()
+    assert event.type == EventType.BARGE_IN
+    assert event.data["vl_session_id"] == "vl-1"
+
+    bus.unsubscribe(sub_id)
@@ -0,0 +1,105 @@
+"""Tests for media bridge frame encoding and inbound parsing."""
+from __future__ import annotations
+
+import base64
+import json
+
+import pytest
+
+from app.models.state import AppState
+from app.services.media_bridge import FRAME_BYTES, _encode_audio_frame, _extract_pcm_from_json, _forward_inbound
+
+
+def test_encode_audio_frame_roundtrip():
+    """Encoded frames are ACS AudioData JSON carrying the base64 PCM."""
+    frame = bytes(range(256)) * 3 + bytes(192)
+    msg = json.loads(_encode_audio_frame(frame))
+    assert msg["kind"] == "AudioData"
+    assert base64.b64decode(msg["audioData"]["data"]) == frame
+
+
+def test_extract_pcm_audio_data_shape():
+    """Nested audioData.data payloads are decoded to PCM."""
+    pcm = b"\x01\x02" * 480
+    text = json.dumps({"kind": "AudioData", "audioData": {"data": base64.b64encode(pcm).decode()}})
+    assert _extract_pcm_from_json(text) == pcm
+
+
+def test_extract_pcm_flat_data_shape():
+    """Flat AudioChunk payloads with a top-level data field are decoded."""
+    pcm = b"\x03\x04" * 10
+    text = json.dumps({"kind": "AudioChunk", "data": base64.b64encode(pcm).decode()})
+    assert _extract_pcm_from_json(text) == pcm
+
+
+def test_extract_pcm_ignores_metadata_and_garbage():
+    """AudioMetadata and non-JSON messages yield no PCM."""
+    assert _extract_pcm_from_json(json.dumps({"kind": "AudioMetadata", "audioMetadata": {"sampleRate": 24000}})) is None
+    assert _extract_pcm_from_json("not json") is None
+
+
+def test_extract_pcm_compact_fast_path_matches_full_parse():
+    """Compact ACS frames take the substring path and decode identically."""
+    pcm = bytes(range(256)) * 3 + bytes(192)
+    msg = {"kind": "AudioData", "audioData": {"timestamp": "t", "data": base64.b64encode(pcm).decode(), "silent": False}}
+    assert _extract_pcm_from_json(json.dumps(msg, separators=(",", ":"))) == pcm
+
+
+def test_extract_pcm_escaped_payload_falls_back_to_parse():
+    """A JSON-escaped base64 body is unescaped by the full parser, not sliced raw."""
+    pcm = b"\xff" * 12  # base64 contains '/'
+    b64 = base64.b64encode(pcm).decode()
+    text = '{"kind":"AudioData","audioData":{"data":"' + b64.replace("/", "\\/") + '"}}'
+    assert _extract_pcm_from_json(text) == pcm
+
+
+class _RecordingSpeech:
+    active = True
+
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def send_audio(self, pcm: bytes) -> None:
+        self.sent.append(pcm)
+
+
+@pytest.mark.asyncio
+async def test_forward_inbound_sends_whole_frames_once():
+    """A multi-frame message is forwarded in one append; the partial tail is returned."""
+    speech = _RecordingSpeech()
+    state = AppState()
+    pcm = bytes(FRAME_BYTES * 3) + b"\x01" * 10
+    tail = await _forward_inbound(pcm, speech, state, "s1")
+    assert speech.sent == [pcm[: FRAME_BYTES * 3]]
+    assert tail == b"\x01" * 10
+    assert state.get_media("s1").in_frames == 3
+
+
+def test_media_ws_counts_text_and_binary_frames(client):
+    """The media socket acks, then accepts both JSON and raw binary audio."""
+    from app.models.state import app_state
+    from app.services.call_manager import call_manager
+
+    session_id = call_manager.get_session_id_for_media_token("tok-rx")
+    before = app_state.get_media(session_id).in_frames
+    pcm = bytes(FRAME_BYTES)
+    with client.websocket_connect("/media/tok-rx") as ws:
+        assert json.loads(ws.receive_text()) == {"type": "ack"}
+        ws.send_text(json.dumps({"kind": "AudioData", "audioData": {"data": base64.b64encode(pcm).decode()}}))
+        ws.send_bytes(pcm)
+    assert app_state.get_media(session_id).in_frames - before == 2
+
+
+def test_media_ws_stitches_fragmented_frames(client):
+    """Half-frame binary messages are joined instead of dropped."""
+    from app.models.state import app_state
+    from app.services.call_manager import call_manager
+
+    session_id = call_manager.get_session_id_for_media_token("tok-frag")
+    before = app_state.get_media(session_id).in_frames
+    half = bytes(FRAME_BYTES // 2)
+    with client.websocket_connect("/media/tok-frag") as ws:
+        ws.receive_text()
+        for _ in range(4):
+            ws.send_bytes(half)
+    assert app_state.get_media(session_id).in_frames - before == 2
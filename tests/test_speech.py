@@ -0,0 +1,43 @@
+"""Tests for SpeechService output buffering."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.speech import FRAME_BYTES, SpeechService
+
+
+@pytest.mark.asyncio
+async def test_wait_for_output_wakes_on_audio_and_close():
+    """A parked consumer resumes when a frame is queued, and again on close."""
+    speech = SpeechService()
+    speech._active = True
+
+    assert await speech.get_next_output_frame() is None
+    waiter = asyncio.ensure_future(speech.wait_for_output())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    speech._buffer_output_audio(bytes(FRAME_BYTES + 10))
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert await speech.get_next_output_frame() == bytes(FRAME_BYTES)
+    assert await speech.get_next_output_frame() is None
+
+    waiter = asyncio.ensure_future(speech.wait_for_output())
+    await speech.close()
+    await asyncio.wait_for(waiter, timeout=1.0)
+
+
+def test_buffer_output_audio_frames_across_deltas():
+    """Deltas are cut into whole frames in order; the remainder waits for more."""
+    speech = SpeechService()
+    pcm = bytes(range(256)) * 12  # 3072 bytes: 3 frames + 192
+    speech._buffer_output_audio(pcm[:1000])
+    speech._buffer_output_audio(pcm[1000:])
+    assert list(speech._output_queue) == [
+        pcm[:FRAME_BYTES],
+        pcm[FRAME_BYTES : 2 * FRAME_BYTES],
+        pcm[2 * FRAME_BYTES : 3 * FRAME_BYTES],
+    ]
+    assert bytes(speech._output_buffer) == pcm[3 * FRAME_BYTES :]